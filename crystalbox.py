@@ -3,11 +3,36 @@
 """
 This is the main script that launches the tool.
 """
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 from src.generators.code_pipeline import CodePipeline
+from src.models.suite import Suite
 from src.parsers.command_line_parser import parse_cmdline
 from src.parsers.config_parser import setup_tests
 
 
+def _run_suite(suite: Suite) -> str:
+    # The backends generate their tester script under the current working
+    # directory, so each worker runs its suite from its own scratch
+    # directory to keep concurrent runs from clobbering each other's
+    # scripts. The rendered report is returned rather than printed here,
+    # since the workers all share the parent's stdout.
+    workdir = tempfile.mkdtemp(prefix='crystalbox-')
+    previous_dir = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        codegen = CodePipeline(suite)
+        return codegen.execute()
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
 def main():
     args = parse_cmdline()
 
@@ -15,9 +40,13 @@ def main():
     # be present.
     the_stuff = setup_tests(args['config_file'])
 
-    for suite in the_stuff:
-        codegen = CodePipeline(suite)
-        codegen.execute()
+    # Each suite is an independent build+run of an external process, so
+    # they can all execute concurrently. Printing happens here in the
+    # parent as map yields, which keeps each suite's report atomic and
+    # in config order no matter how the workers finish.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for report in executor.map(_run_suite, the_stuff):
+            sys.stdout.write(report)
 
 
 if __name__ == '__main__':
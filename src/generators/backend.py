@@ -1,6 +1,9 @@
 # File: backend.py
 
+import os
+
 from abc import ABC, abstractmethod
+from functools import cache
 from itertools import zip_longest
 from pathlib import Path
 from string import Template
@@ -42,18 +45,18 @@ class Backend(ABC):
     @abstractmethod
     def get_and_fill_script_template(
             self,
-            templates: dict[str, Template],
+            templates: dict[str, Template | str],
             suite: Suite,
-            tests: list[str]
+            tests: str
     ) -> str:
         pass
 
     @abstractmethod
     def get_and_fill_tests_template(
             self,
-            templates: dict[str, Template],
+            templates: dict[str, Template | str],
             suite: Suite
-    ) -> list[str]:
+    ) -> str:
         pass
 
     @abstractmethod
@@ -65,8 +68,11 @@ class Backend(ABC):
         tests = self.get_and_fill_tests_template(templates, suite)
         script = self.get_and_fill_script_template(templates, suite, tests)
 
-        with open(self.tester_script, 'w') as f:
-            f.write(f'{script}\n')
+        # Binary mode skips text-mode's per-write newline translation and
+        # incremental-encoder machinery; the script is encoded in one shot.
+        with open(self.tester_script, 'wb') as f:
+            f.write(script.encode('utf-8'))
+            f.write(b'\n')
 
     def execute_pipeline(self, suite: Suite) -> None:
         """
@@ -107,20 +113,24 @@ class Backend(ABC):
             return
 
         # Set the results to each test, so that the next step in the
-        # pipeline can evaluate correctness or failure.
+        # pipeline can evaluate correctness or failure. The captured
+        # lines are normalized in a single comprehension up front, so the
+        # pairing loop is just one attribute store per test.
+
+        outputs = [line.rstrip() or '<empty>' for line in run_result.output]
 
         for test_output, test_case \
-                in zip_longest(run_result.output,
+                in zip_longest(outputs,
                                suite.tests,
                                fillvalue='<missing output>'):
-            test_case.stdout = test_output.rstrip() or '<empty>'
+            test_case.stdout = test_output
 
         if run_result.err_pipe:
             suite.stderr_lines = run_result.err_pipe
 
         self.cleanup()
 
-    def fetch_templates(self) -> dict[str, Template]:
+    def fetch_templates(self) -> dict[str, Template | str]:
         """
         Searches for the templates corresponding to the specified programming
         language. These templates follow the conventions of Python's Template
@@ -132,25 +142,7 @@ class Backend(ABC):
             object created from the template file as value.
         """
 
-        templates_dir = Path(__file__).resolve().parent.parent / 'templates'
-        templates_files = [item for item in templates_dir.iterdir()
-                           if item.is_file() and item.name.startswith(self.language)]
-
-        result = {}
-
-        for f in templates_files:
-            # All template files follow the convention:
-            # <language>.<type>.template
-            template_type = f.name.split('.')[1]
-
-            try:
-                with open(f, 'r') as temp_f:
-                    result[template_type] = Template(temp_f.read())
-            except OSError:
-                print_error(f'Something went wrong reading template file "{f}".')
-                raise
-
-        return result
+        return _load_templates(self.language)
 
     def _build(self, src: Path) -> ProcessResult | None:
         """
@@ -193,3 +185,59 @@ class Backend(ABC):
             return None
 
         return run_process(run_cmd)
+
+
+# Placeholders of the per-test templates, which get rewritten to
+# str.format fields so rendering a test case does not re-parse the
+# template like Template.substitute does.
+_TEST_PLACEHOLDERS = ('index', 'args', 'function')
+
+
+@cache
+def _load_templates(language: ProgrammingLanguage) -> dict[str, Template | str]:
+    """
+    Reads and compiles the template files of the given language. The
+    template set of a language never changes during a run, so the result
+    is cached and shared by every backend instance of that language,
+    however many times they are re-instantiated.
+    """
+
+    templates_dir = Path(__file__).resolve().parent.parent / 'templates'
+
+    # scandir answers is_file() from the directory entry itself,
+    # whereas Path.iterdir costs an extra stat syscall per entry.
+    with os.scandir(templates_dir) as entries:
+        templates_files = [Path(entry.path) for entry in entries
+                           if entry.is_file()
+                           and entry.name.startswith(language)]
+
+    result = {}
+
+    for f in templates_files:
+        # All template files follow the convention:
+        # <language>.<type>.template
+        template_type = f.name.split('.')[1]
+
+        try:
+            # Binary mode reads the small template files in one gulp and
+            # decodes once, instead of going through the text layer's
+            # incremental decoder and newline translation.
+            with open(f, 'rb') as temp_f:
+                content = temp_f.read().decode('utf-8')
+        except OSError:
+            print_error(f'Something went wrong reading template file "{f}".')
+            raise
+
+        result[template_type] = Template(content)
+
+        # The test template is rendered once per test case, so it is
+        # also stored as a plain format string. str.format does not
+        # re-parse the template on every call like Template.substitute
+        # does, which makes a difference for suites with many cases.
+        if template_type == 'test':
+            fmt = content.replace('{', '{{').replace('}', '}}')
+            for placeholder in _TEST_PLACEHOLDERS:
+                fmt = fmt.replace(f'${placeholder}', f'{{{placeholder}}}')
+            result['test_fmt'] = fmt
+
+    return result
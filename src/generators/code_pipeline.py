@@ -24,7 +24,14 @@ class CodePipeline:
         self.the_suite = suite
         self.engine_backend = get_backend(self.language)
 
-    def execute(self):
+    def execute(self) -> str:
         self.engine_backend.execute_pipeline(self.the_suite)
         self.the_suite.evaluate_tests()
-        print(self.the_suite.to_color_print())
+
+        # Pipelines run inside a process pool where every worker shares
+        # the parent's stdout, so streaming the report line by line from
+        # here would interleave concurrent suites. Instead the report is
+        # buffered into one string and handed back, so the caller can
+        # emit it atomically; write_color_report stays the streaming
+        # path for streams with a single owner.
+        return self.the_suite.to_color_print() + '\n'
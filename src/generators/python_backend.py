@@ -1,12 +1,9 @@
 # File: python_backend
 
-import contextlib
-import os
-import shutil
 from pathlib import Path
 from string import Template
 
-from src.utils.common import ProgrammingLanguage
+from src.utils.common import ProgrammingLanguage, find_executable
 from src.generators.backend import Backend
 from src.models.suite import Suite
 
@@ -16,46 +13,42 @@ class PythonBackend(Backend):
     Inheriting Backend class for Python specific functionality.
     """
 
-    def __init__(self):
-        self.language = ProgrammingLanguage.PYTHON
-        super().__init__()
+    language = ProgrammingLanguage.PYTHON
 
     def get_build_command(self, src: Path) -> str | None:
         return 'nobuild'
 
     def get_run_command(self) -> str | None:
-        commands = ['py', 'python', 'python3']
-        for cmd in commands:
-            if shutil.which(cmd):
-                return f'{cmd} {self.tester_script}'
+        if runtime := find_executable('py', 'python', 'python3'):
+            return f'{runtime} {self.tester_script}'
         return None
 
     def get_and_fill_script_template(
             self,
-            templates: dict[str, Template],
+            templates: dict[str, Template | str],
             suite: Suite,
-            tests: list[str]
+            tests: str
     ) -> str:
         return templates['main'].substitute({
             'src': suite.source_file_path.as_posix(),
             'function': suite.function_name,
-            'test_cases': '\n'.join(tests)
+            'test_cases': tests
         })
 
     def get_and_fill_tests_template(
             self,
-            templates: dict[str, Template],
+            templates: dict[str, Template | str],
             suite: Suite
-    ) -> list[str]:
-        return [
-            templates['test'].substitute({
-                'index': i,
-                'function': suite.function_name,
-                'args': ', '.join(map(str, tst_case.inputs))
-            })
+    ) -> str:
+        # Bind the invariants to locals so the comprehension does not
+        # re-resolve them on every test case.
+        render = templates['test_fmt'].format
+        function_name = suite.function_name
+
+        return '\n'.join(
+            render(index=i, function=function_name, args=tst_case.args_str)
             for i, tst_case in enumerate(suite.tests, start=1)
-        ]
+        )
 
     def cleanup(self) -> None:
-        with contextlib.suppress(FileNotFoundError):
-            os.remove(self.tester_script)
+        self.tester_script.unlink(missing_ok=True)
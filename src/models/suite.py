@@ -5,85 +5,154 @@ This file contains the models to store all the data related to test cases,
 runs, and their results.
 """
 
-from dataclasses import dataclass
-from enum import StrEnum
+import io
+import os
+import sys
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, Final, TextIO
 
 from src.utils.common import ConfigField
 from src.utils.text_utils import Color, colorize, make_banner
 
 
-class TestStatus(StrEnum):
-    PASSED = 'Passed'
-    FAILED = 'Failed'
-    NOT_RUN = 'Not Run'
+class TestStatus:
+    """
+    Namespace of plain test status strings. Interning them guarantees
+    the three values stay singletons, so the hot `status is PASSED`
+    style checks keep working without StrEnum's member descriptors and
+    __format__ hooks.
+    """
+
+    PASSED: Final[str] = sys.intern('Passed')
+    FAILED: Final[str] = sys.intern('Failed')
+    NOT_RUN: Final[str] = sys.intern('Not Run')
+
+
+# These labels are identical for every test case of every suite, so the
+# ANSI-wrapped strings are built once at import instead of per print.
+_INPUT_LABEL = colorize('Input Params:', Color.YELLOW)
+_EXPECTED_LABEL = colorize('Expected:', Color.LIGHT_RED)
+_ACTUAL_LABEL = colorize('Actual:', Color.LIGHT_RED)
+_STDERR_LABEL = colorize('There were also other errors:', Color.RED)
+
+_STATUS_COLORS: dict[str, str] = {
+    TestStatus.PASSED: Color.LIGHT_GREEN,
+    TestStatus.FAILED: Color.LIGHT_RED,
+    TestStatus.NOT_RUN: Color.LIGHT_YELLOW
+}
+
+# Pre-render the one possible status line per status, so printing a test
+# costs a dict lookup instead of a colorize call and an f-string build.
+_STATUS_BANNERS: dict[str, str] = {
+    status: colorize(f'Test {status}!', color)
+    for status, color in _STATUS_COLORS.items()
+}
 
 
-@dataclass
 class TestCaseDescription:
     """
-    A dataclass containing all the information related to a specific test
-    case, from a specific suite.
+    A class containing all the information related to a specific test
+    case, from a specific suite. Suites can carry tens of thousands of
+    test cases, so instances are slotted to keep them small and cheap
+    to construct.
 
     Attributes:
         test_id (int): Unique identifier for reporting and finding the test.
         inputs: (list[Any]): Arguments to pass to the function to test.
         expected_output (str): String expected to be printed when running the test.
+        args_str (str): The inputs pre-rendered as a comma-separated string,
+                        ready for script generation and reporting.
         stdout (str | None): Actual data printed to stdout.
         stderr (str | None): Error data printed to stderr (if any).
         status (TestStatus): Current status of the test case.
     """
 
-    _status_colors_field: ClassVar[dict[TestStatus, Color]] = {
-        TestStatus.PASSED: Color.LIGHT_GREEN,
-        TestStatus.FAILED: Color.LIGHT_RED,
-        TestStatus.NOT_RUN: Color.LIGHT_YELLOW
-    }
-
-    test_id: int
-    inputs: list[Any]
-    expected_output: str
-    stdout: str | None = None
-    stderr: str | None = None
-    status: TestStatus = TestStatus.NOT_RUN
-
-    def __post_init__(self):
-        self.expected_output = str(self.expected_output)
-
-    @property
-    def _status_colors(self) -> dict[TestStatus, Color]:
-        return self._status_colors_field
-
-    def evaluate(self) -> None:
-        self.status = (TestStatus.PASSED if self.stdout == self.expected_output
-                       else TestStatus.FAILED)
+    __slots__ = ('test_id', 'inputs', 'expected_output', 'args_str',
+                 'stdout', 'stderr', 'status')
+
+    def __init__(self, test_id: int, inputs: list[Any], expected_output: Any):
+        self.test_id = test_id
+        self.inputs = inputs
+
+        # Config outputs are almost always strings already, so the exact
+        # type check skips a redundant str() call per test (and isinstance's
+        # MRO walk). Interning short expected outputs then lets identical
+        # strings across repeated suites share one object, so evaluate()
+        # can pass on a bare pointer comparison.
+        expected = (expected_output if type(expected_output) is str
+                    else str(expected_output))
+        self.expected_output = (sys.intern(expected) if len(expected) < 4096
+                                else expected)
+        self.args_str = ', '.join(map(str, inputs))
+        self.stdout: str | None = None
+        self.stderr: str | None = None
+        self.status = TestStatus.NOT_RUN
+
+    def evaluate(self) -> str:
+        # Identity and length prechecks settle most comparisons without
+        # touching the strings' contents, and the None guard covers tests
+        # that never received output.
+        actual, expected = self.stdout, self.expected_output
+        self.status = (
+            TestStatus.PASSED
+            if actual is expected
+            or (actual is not None
+                and len(actual) == len(expected)
+                and actual == expected)
+            else TestStatus.FAILED
+        )
+        return self.status
 
     def to_color_string(self) -> str:
-        lines = [
-            make_banner(f'Test #{self.test_id}', '-', Color.LIGHT_MAGENTA),
-            '',
-            f'{colorize("Input Params:", Color.YELLOW)} {", ".join(map(str, self.inputs))}',
-            colorize(f'Test {self.status}!', self._status_colors[self.status])
-        ]
+        buf = io.StringIO()
+        self.write_color_string(buf)
+        return buf.getvalue()
+
+    def to_color_string_compact(self) -> str:
+        """
+        One-line form of the report block: just the test id and its
+        pre-rendered status line, with no banner or input listing.
+        """
+
+        return f'Test #{self.test_id}: {_STATUS_BANNERS[self.status]}'
+
+    def write_color_string(self, stream: TextIO) -> None:
+        """
+        Streams this test case's block of the report directly into the
+        given stream, so callers do not have to hold the formatted block
+        in memory.
+        """
+
+        write = stream.write
+
+        write(make_banner(f'Test #{self.test_id}', '-', Color.LIGHT_MAGENTA))
+        write('\n\n')
+        write(_INPUT_LABEL)
+        write(' ')
+        write(self.args_str)
+        write('\n')
+        write(_STATUS_BANNERS[self.status])
 
         if self.status is TestStatus.FAILED:
-            lines.append(self._get_expected_vs_actual_string())
+            write('\n')
+            write(self._get_expected_vs_actual_string())
 
         if self.stderr:
-            lines.append(self._get_stderr_string())
-
-        return '\n'.join(lines)
+            write('\n')
+            write(self._get_stderr_string())
 
     def _get_expected_vs_actual_string(self) -> str:
         return (
-            f'{colorize("Expected:", Color.LIGHT_RED)} {self.expected_output}\n'
-            f'{colorize("Actual:", Color.LIGHT_RED)} {self.stdout}'
+            f'{_EXPECTED_LABEL} {self.expected_output}\n'
+            f'{_ACTUAL_LABEL} {self.stdout}'
         )
 
     def _get_stderr_string(self) -> str:
         return (
-            f'{colorize("There were also other errors:", Color.RED)}\n\n'
+            f'{_STDERR_LABEL}\n\n'
             f'{colorize(self.stderr, Color.RED)}'
         )
 
@@ -113,17 +182,25 @@ class Suite:
         # exists, and "source_file" has been converted to "Path".
         self.source_file_path = suite_data[ConfigField.SOURCE_FILE]
         self.function_name = suite_data[ConfigField.FUNCTION_NAME]
-        self.stderr = None
-
-        self.tests = [
-            TestCaseDescription(
-                test_id=i,
-                inputs=test_data[ConfigField.INPUT],
-                expected_output=test_data[ConfigField.OUTPUT]
-            )
-            for i, test_data in enumerate(suite_data[ConfigField.TEST_CASES],
-                                          start=1)
-        ]
+        self.stderr_lines = None
+
+        # Configs can carry tens of thousands of cases, so the list is
+        # preallocated and filled through locals: the hoisted keys and
+        # class turn the per-case lookups into LOAD_FASTs, and positional
+        # construction skips the keyword-argument handling.
+        raw_cases = suite_data[ConfigField.TEST_CASES]
+        test_case_cls = TestCaseDescription
+        input_key = ConfigField.INPUT
+        output_key = ConfigField.OUTPUT
+
+        tests: list[TestCaseDescription] = [None] * len(raw_cases)
+
+        for i, test_data in enumerate(raw_cases):
+            tests[i] = test_case_cls(i + 1,
+                                     test_data[input_key],
+                                     test_data[output_key])
+
+        self.tests = tests
 
         self.passed = 0
         self.failed = 0
@@ -133,37 +210,78 @@ class Suite:
     def source_file_name(self) -> str:
         return self.source_file_path.name
 
-    def evaluate_tests(self) -> None:
-        for tc in self.tests:
-            tc.evaluate()
-
-            if tc.status is TestStatus.PASSED:
-                self.passed += 1
-            elif tc.status is TestStatus.FAILED:
-                self.failed += 1
-            elif tc.status is TestStatus.NOT_RUN:
-                self.not_run += 1
-
-    def to_color_print(self) -> str:
-        lines = [
-            '\n',
-            make_banner(f'Suite of {self.source_file_name}', '*', Color.LIGHT_BLUE),
-            colorize(f'\nFunction executed: {self.function_name}', Color.CYAN),
-            '',
-            '\n\n'.join(tc.to_color_string() for tc in self.tests),
-            '',
-            make_banner('Suite Summary', '=', Color.LIGHT_CYAN),
-            colorize(f'\nPassed: {self.passed}', Color.LIGHT_GREEN),
-            colorize(f'Failed: {self.failed}', Color.LIGHT_RED),
-            colorize(f'Not Run: {self.not_run}', Color.LIGHT_YELLOW)
-        ]
+    # Suites smaller than this are cheaper to evaluate serially than to
+    # dispatch to a pool.
+    _PARALLEL_EVAL_THRESHOLD = 500
+
+    def evaluate_tests(self, workers: int | None = None) -> None:
+        # evaluate() hands its status back, so the tallying happens in
+        # one Counter pass instead of an if/elif chain per test. Each
+        # evaluation is an independent string comparison, so very large
+        # suites spread the work over a thread pool; pass workers=1 to
+        # force serial evaluation.
+        if len(self.tests) > self._PARALLEL_EVAL_THRESHOLD and workers != 1:
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                counts = Counter(executor.map(TestCaseDescription.evaluate,
+                                              self.tests,
+                                              chunksize=64))
+        else:
+            counts = Counter(tc.evaluate() for tc in self.tests)
+
+        self.passed = counts[TestStatus.PASSED]
+        self.failed = counts[TestStatus.FAILED]
+        self.not_run = counts[TestStatus.NOT_RUN]
+
+    def to_color_print(self, summary_only: bool = False) -> str:
+        buf = io.StringIO()
+        self.write_color_report(buf, summary_only)
+        return buf.getvalue()
+
+    def write_color_report(self, stream: TextIO,
+                           summary_only: bool = False) -> None:
+        """
+        Streams the whole suite report into the given stream, block by
+        block. Writing to stdout this way keeps peak memory constant in
+        the number of tests, instead of materializing the entire report
+        as one string first.
+
+        With summary_only, passing tests collapse to their one-line
+        compact form, so a mostly-green suite only pays the full
+        formatting cost for its failures.
+        """
+
+        write = stream.write
+
+        write('\n\n')
+        write(make_banner(f'Suite of {self.source_file_name}', '*', Color.LIGHT_BLUE))
+        write('\n')
+        write(colorize(f'\nFunction executed: {self.function_name}', Color.CYAN))
+        write('\n\n')
+
+        for i, tc in enumerate(self.tests):
+            if i:
+                write('\n\n')
+
+            if summary_only and tc.status is TestStatus.PASSED:
+                write(tc.to_color_string_compact())
+            else:
+                tc.write_color_string(stream)
+
+        write('\n\n')
+        write(make_banner('Suite Summary', '=', Color.LIGHT_CYAN))
+        write('\n')
+        write(colorize(f'\nPassed: {self.passed}', Color.LIGHT_GREEN))
+        write('\n')
+        write(colorize(f'Failed: {self.failed}', Color.LIGHT_RED))
+        write('\n')
+        write(colorize(f'Not Run: {self.not_run}', Color.LIGHT_YELLOW))
 
         if self.stderr_lines:
-            lines.extend([
-                '',
-                make_banner('Errors', '=', Color.RED),
-                '',
-                '\n'.join(colorize(line, Color.RED) for line in self.stderr_lines)
-            ])
-
-        return '\n'.join(lines)
+            write('\n\n')
+            write(make_banner('Errors', '=', Color.RED))
+            write('\n\n')
+
+            for i, line in enumerate(self.stderr_lines):
+                if i:
+                    write('\n')
+                write(colorize(line, Color.RED))
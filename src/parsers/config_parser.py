@@ -6,6 +6,7 @@ and parse the input JSON file, and prepare the objects to run the tests.
 """
 
 import json
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Any
@@ -65,11 +66,16 @@ def setup_tests(json_config_file: str | PathLike) -> list[Suite]:
 
 def _parse_suite_data(base_path: Path | None, suite_desc: dict[str, Any]) -> Suite | None:
     # If "source" was missing or invalid, validate_suite_data() will catch it.
-    suite_desc[ConfigField.SOURCE_FILE] = (
-        base_path / suite_desc.get(ConfigField.SOURCE_FILE, '')
-        if base_path is not None
-        else Path(suite_desc.get(ConfigField.SOURCE_FILE, '')).expanduser().resolve()
-    )
+    src = suite_desc.get(ConfigField.SOURCE_FILE, '')
+
+    if base_path is not None:
+        suite_desc[ConfigField.SOURCE_FILE] = base_path / src
+    else:
+        # Configs tend to point all their suites under the same few
+        # directories, so the symlink-chasing resolve() is cached per
+        # directory and only the file name is appended per suite.
+        src = Path(src)
+        suite_desc[ConfigField.SOURCE_FILE] = _resolve_dir(str(src.parent)) / src.name
 
     if not _validate_suite_data(suite_desc):
         print_warning('Suite description was malformed or is missing data. '
@@ -79,29 +85,41 @@ def _parse_suite_data(base_path: Path | None, suite_desc: dict[str, Any]) -> Sui
     return Suite(suite_desc)
 
 
+@lru_cache(maxsize=None)
+def _resolve_dir(directory: str) -> Path:
+    return Path(directory).expanduser().resolve()
+
+
 def _validate_suite_data(suite_desc: dict[str, Any]) -> bool:
-    errors = []
+    valid = True
 
     source_file = suite_desc.get(ConfigField.SOURCE_FILE)
     function_name = suite_desc.get(ConfigField.FUNCTION_NAME)
     cases = suite_desc.get(ConfigField.TEST_CASES)
 
     if not source_file or not source_file.is_file():
-        errors.append(f'Source file "{source_file}" was not found.')
+        print_error(f'Source file "{source_file}" was not found')
+        valid = False
 
     if not function_name:
-        errors.append('Function name to run is missing.')
+        print_error('Function name to run is missing')
+        valid = False
 
     if not cases:
-        errors.append('No test cases were found.')
+        print_error('No test cases were found')
+        valid = False
     else:
+        # The whole suite is skipped on any error, so there is no point
+        # walking the remaining cases once one is known to be malformed.
         for i, case in enumerate(cases, start=1):
             if not case.get(ConfigField.INPUT):
-                errors.append(f'Test Case #{i} is missing input arguments.')
-            if not case.get(ConfigField.OUTPUT):
-                errors.append(f'Test Case #{i} is missing expected output.')
+                print_error(f'Test Case #{i} is missing input arguments')
+                valid = False
+                break
 
-    for err in errors:
-        print_error(err)
+            if not case.get(ConfigField.OUTPUT):
+                print_error(f'Test Case #{i} is missing expected output')
+                valid = False
+                break
 
-    return not errors
+    return valid
@@ -4,8 +4,12 @@
 This file contains general utilities used throughout the codebase.
 """
 
+import os
+import shlex
+import shutil
 import subprocess
 from enum import Enum, StrEnum, auto
+from functools import lru_cache
 from typing import NamedTuple
 
 from src.utils.text_utils import print_critical
@@ -43,11 +47,42 @@ class LanguageExtensionMapping(Enum):
 
     @classmethod
     def from_extension(cls, ext: str) -> ProgrammingLanguage:
-        try:
-            return cls[ext.upper()].value
-        except KeyError:
-            print_critical(f'\nFile extension "{ext}" not supported.\n')
-            raise
+        return _language_from_extension(ext)
+
+
+# Configs routinely repeat the same handful of extensions across their
+# suites, so the upper-casing plus enum lookup is memoized here. The
+# cache only ever holds one entry per supported extension spelling.
+@lru_cache(maxsize=32)
+def _language_from_extension(ext: str) -> ProgrammingLanguage:
+    try:
+        return LanguageExtensionMapping[ext.upper()].value
+    except KeyError:
+        print_critical(f'\nFile extension "{ext}" not supported.\n')
+        raise
+
+
+@lru_cache(maxsize=None)
+def find_executable(*names: str) -> str | None:
+    """
+    Looks up the first of the given executable names that is available
+    on PATH. shutil.which walks and stats every PATH entry, and the
+    installed toolchain does not change during a run, so the result is
+    cached per name tuple.
+
+    Args:
+        names: Candidate executable names, in order of preference.
+
+    Returns:
+        Path to the first executable found, or None if none of them are
+        installed.
+    """
+
+    for name in names:
+        if found := shutil.which(name):
+            return found
+
+    return None
 
 
 class ProcessResult(NamedTuple):
@@ -69,26 +104,27 @@ def run_process(cmdargs: str | list[str]) -> ProcessResult:
         ProcessResult named tuple with the exit code and the process' output.
     """
 
+    # On POSIX, Popen only accepts a whole command line as a single string
+    # when shell=True, so commands built as strings have to be split into
+    # their argument lists first. Windows hands the string over as-is.
+    if isinstance(cmdargs, str) and os.name == 'posix':
+        cmdargs = shlex.split(cmdargs)
+
     process = subprocess.Popen(
         args=cmdargs,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
-        bufsize=1
+        bufsize=-1
     )
 
-    output_lines = []
-    for line in process.stdout:
-        output_lines.append(line.rstrip())
-
-    err_lines = []
-    for line in process.stderr:
-        err_lines.append(line.rstrip())
-
-    process.wait()
+    # communicate() drains both pipes in bulk and waits for the process,
+    # and splitlines() tokenizes the whole capture in one C-level pass
+    # instead of a Python-level loop per printed line.
+    stdout_data, stderr_data = process.communicate()
 
     return ProcessResult(
         exit_code=process.returncode,
-        output=output_lines,
-        err_pipe=err_lines
+        output=stdout_data.splitlines(),
+        err_pipe=stderr_data.splitlines()
     )
@@ -5,64 +5,167 @@ This file contains the utilities and helpers for processing text to print,
 namely formatting and colorizing it.
 """
 
-from enum import StrEnum
-from typing import Any
-
-import colorama
-
-colorama.init(autoreset=True)
-Fore = colorama.Fore
-
-
-class Color(StrEnum):
-    DEFAULT = Fore.RESET
-
-    BLACK = Fore.BLACK
-    BLUE = Fore.BLUE
-    CYAN = Fore.CYAN
-    GREEN = Fore.GREEN
-    MAGENTA = Fore.MAGENTA
-    RED = Fore.RED
-    YELLOW = Fore.YELLOW
-    WHITE = Fore.WHITE
-
-    LIGHT_BLACK = Fore.LIGHTBLACK_EX
-    LIGHT_BLUE = Fore.LIGHTBLUE_EX
-    LIGHT_CYAN = Fore.LIGHTCYAN_EX
-    LIGHT_GREEN = Fore.LIGHTGREEN_EX
-    LIGHT_MAGENTA = Fore.LIGHTMAGENTA_EX
-    LIGHT_RED = Fore.LIGHTRED_EX
-    LIGHT_YELLOW = Fore.LIGHTYELLOW_EX
-    LIGHT_WHITE = Fore.LIGHTWHITE_EX
-
-
-def colorize(item: Any, color: Color) -> str:
-    return (
-        f'{color}{item}{Color.DEFAULT}'
-        if color is not Color.DEFAULT
-        else f'{item}'
-    )
-
+import sys
+
+from functools import lru_cache
+from typing import Any, Final
+
+# ANSI escapes work natively everywhere except the legacy Windows
+# console, so colorama is only imported there (its stdout hook parses
+# ANSI in Python on every write). Everywhere else this shim provides
+# the same Fore constants, with the exact codes colorama uses, and the
+# native stream stays untouched. No autoreset is needed anywhere, since
+# colorize() already closes everything it opens with an explicit reset.
+if sys.platform == 'win32':
+    import colorama
+
+    if sys.stdout.isatty():
+        colorama.just_fix_windows_console()
+
+    Fore = colorama.Fore
+else:
+    class Fore:
+        RESET = '\x1b[39m'
+
+        BLACK = '\x1b[30m'
+        RED = '\x1b[31m'
+        GREEN = '\x1b[32m'
+        YELLOW = '\x1b[33m'
+        BLUE = '\x1b[34m'
+        MAGENTA = '\x1b[35m'
+        CYAN = '\x1b[36m'
+        WHITE = '\x1b[37m'
+
+        LIGHTBLACK_EX = '\x1b[90m'
+        LIGHTRED_EX = '\x1b[91m'
+        LIGHTGREEN_EX = '\x1b[92m'
+        LIGHTYELLOW_EX = '\x1b[93m'
+        LIGHTBLUE_EX = '\x1b[94m'
+        LIGHTMAGENTA_EX = '\x1b[95m'
+        LIGHTCYAN_EX = '\x1b[96m'
+        LIGHTWHITE_EX = '\x1b[97m'
+
+# When stdout is a pipe or a file there is no terminal to interpret
+# escape codes, so colorizing is turned off wholesale and logs stay
+# free of ANSI noise. This flag is the single switch the wrap table and
+# the log prefixes below are derived from, and each colorized item ends
+# with exactly one explicit reset from colorize() — there is no
+# autoreset layer appending a second one per line.
+_ANSI_ENABLED = sys.stdout.isatty()
+
+
+class Color:
+    """
+    Namespace of plain ANSI code strings. These used to be a StrEnum,
+    but every member access and dict lookup then went through the Enum
+    descriptor machinery; bare str constants keep the same Color.NAME
+    API with none of that overhead.
+    """
+
+    DEFAULT: Final[str] = Fore.RESET
+
+    BLACK: Final[str] = Fore.BLACK
+    BLUE: Final[str] = Fore.BLUE
+    CYAN: Final[str] = Fore.CYAN
+    GREEN: Final[str] = Fore.GREEN
+    MAGENTA: Final[str] = Fore.MAGENTA
+    RED: Final[str] = Fore.RED
+    YELLOW: Final[str] = Fore.YELLOW
+    WHITE: Final[str] = Fore.WHITE
+
+    LIGHT_BLACK: Final[str] = Fore.LIGHTBLACK_EX
+    LIGHT_BLUE: Final[str] = Fore.LIGHTBLUE_EX
+    LIGHT_CYAN: Final[str] = Fore.LIGHTCYAN_EX
+    LIGHT_GREEN: Final[str] = Fore.LIGHTGREEN_EX
+    LIGHT_MAGENTA: Final[str] = Fore.LIGHTMAGENTA_EX
+    LIGHT_RED: Final[str] = Fore.LIGHTRED_EX
+    LIGHT_YELLOW: Final[str] = Fore.LIGHTYELLOW_EX
+    LIGHT_WHITE: Final[str] = Fore.LIGHTWHITE_EX
+
+
+# All the color constants, for building the tables below; vars() keeps
+# out the class dunders.
+_ALL_COLORS: tuple[str, ...] = tuple(
+    value for name, value in vars(Color).items() if not name.startswith('_')
+)
+
+# Open/close ANSI pairs per color, computed once at import. DEFAULT
+# wraps with empty strings, which removes the per-call branch entirely,
+# and every pair goes empty when stdout cannot render colors anyway.
+_RESET = Color.DEFAULT
+
+_WRAP: dict[str, tuple[str, str]] = (
+    {color: (color, _RESET) for color in _ALL_COLORS}
+    if _ANSI_ENABLED
+    else {color: ('', '') for color in _ALL_COLORS}
+)
+_WRAP[Color.DEFAULT] = ('', '')
+
+
+def colorize(item: Any, color: str, _wrap=_WRAP) -> str:
+    # The keyword default turns the table lookup into a LOAD_FAST, and
+    # the precomputed pairs replace the old f-string build; wrapping is
+    # two concats. This outperforms caching the results, which grew
+    # unboundedly with dynamic items.
+    open_, close = _wrap[color]
+    return open_ + str(item) + close
+
+
+_BANNER_CACHE: dict[tuple[str, str, str], str] = {}
+
+
+# Banner widths repeat constantly across suites (every test banner only
+# differs by its id), so the border allocations are shared too.
+@lru_cache(maxsize=256)
+def _border(banner_char: str, banner_len: int) -> str:
+    return banner_char * banner_len
+
+
+def make_banner(text: str, banner_char: str, color: str = Color.DEFAULT) -> str:
+    if (cached := _BANNER_CACHE.get((text, banner_char, color))) is not None:
+        return cached
 
-def make_banner(text: str, banner_char: str, color: Color = Color.DEFAULT) -> str:
     # Adding +4 here to take into account the chars/spaces surrounding
     # the text in the banner.
-    banner_len = len(text) + 4
-    banner_border = banner_char * banner_len
+    border = _border(banner_char, len(text) + 4)
 
-    return colorize(
-        f'{banner_border}\n{banner_char} {text} {banner_char}\n{banner_border}',
+    banner = colorize(
+        '\n'.join((border, f'{banner_char} {text} {banner_char}', border)),
         color
     )
 
+    _BANNER_CACHE[(text, banner_char, color)] = banner
+    return banner
+
+
+# The log helpers can fire once per test on noisy runs, so their colored
+# prefixes and trailers are prebuilt from the wrap table (and therefore
+# stay plain when ANSI is off). Writing the pieces directly also skips
+# print's sep/end/file argument handling per log line.
+_CRITICAL_PREFIX = _WRAP[Color.RED][0] + 'TOOL ERROR: '
+_ERROR_PREFIX = _WRAP[Color.LIGHT_RED][0] + 'ERROR: '
+_WARNING_PREFIX = _WRAP[Color.LIGHT_YELLOW][0] + 'WARNING: '
+
+_RESET_NL = _WRAP[Color.RED][1] + '\n'
+_DOT_RESET_NL = '.' + _RESET_NL
+
 
 def print_critical(msg: str) -> None:
-    print(colorize(f'TOOL ERROR: {msg}', Color.RED))
+    write = sys.stdout.write
+    write(_CRITICAL_PREFIX)
+    write(msg)
+    write(_RESET_NL)
 
 
 def print_error(msg: str) -> None:
-    print(colorize(f'ERROR: {msg}.', Color.LIGHT_RED))
+    write = sys.stdout.write
+    write(_ERROR_PREFIX)
+    write(msg)
+    write(_DOT_RESET_NL)
 
 
 def print_warning(msg: str) -> None:
-    print(colorize(f'WARNING: {msg}.', Color.LIGHT_YELLOW))
+    write = sys.stdout.write
+    write(_WARNING_PREFIX)
+    write(msg)
+    write(_DOT_RESET_NL)